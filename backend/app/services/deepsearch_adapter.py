@@ -1,4 +1,3 @@
-import asyncio
 from datetime import datetime
 from typing import Optional, Dict, Any
 import sys
@@ -32,12 +31,20 @@ logger = get_logger("deepsearch.adapter")
 
 class DeepSearchAdapter:
     """Adapter service to interface with the existing DeepSearch system."""
+
+    # Graph node name -> UI step type, unknown nodes are shown as plan steps
+    _STEP_TYPES = {
+        'plan': StepType.PLAN, 'search': StepType.SEARCH, 'code': StepType.CODE,
+        'llm': StepType.LLM, 'solve': StepType.SOLVE, 'replan': StepType.REPLAN
+    }
     
     def __init__(self, websocket_manager: WebSocketManager, session_manager: SessionManager):
         self.websocket_manager = websocket_manager
         self.session_manager = session_manager
         self.current_search_id: Optional[str] = None
         self._processed_llm_steps: set = set()
+        # Search step names already rendered for the current plan
+        self._shown_search_results: set = set()
         
         if not DEEPSEARCH_AVAILABLE:
             logger.warning("DeepSearch graph module not available - running in mock mode")
@@ -47,6 +54,7 @@ class DeepSearchAdapter:
         self.current_search_id = search_id
         # Clear processed LLM steps for new search
         self._processed_llm_steps.clear()
+        self._shown_search_results.clear()
         
         try:
             # Initialize state similar to test_deepsearch.py
@@ -73,8 +81,18 @@ class DeepSearchAdapter:
             processed_nodes = set()
             final_state = {}
             
-            # Process graph events
-            async for event in graph.astream(initial_state, {"recursion_limit": 50}):
+            # Process graph events: "debug" task events announce a node before it
+            # runs, "updates" events carry its state update once it has finished
+            async for mode, event in graph.astream(
+                initial_state, {"recursion_limit": 50}, stream_mode=["updates", "debug"]
+            ):
+                if mode == "debug":
+                    if isinstance(event, dict) and event.get("type") == "task":
+                        node_name = (event.get("payload") or {}).get("name")
+                        if node_name in self._STEP_TYPES and f"{node_name}_{step_counter}" not in processed_nodes:
+                            await self._create_running_step(node_name, final_state, search_id, step_counter)
+                    continue
+
                 if not (event and isinstance(event, dict) and event):
                     continue
                     
@@ -154,22 +172,50 @@ class DeepSearchAdapter:
             logger.error(f"DeepSearch execution failed for search {search_id}: {e}")
             raise DeepSearchIntegrationException(f"Failed to execute search: {str(e)}", graph_error=e)
     
+    async def _create_running_step(self, node_name: str, state: Dict[str, Any], search_id: str, step_counter: int):
+        """Broadcast a running step for a node that is about to execute."""
+        try:
+            if node_name == 'search':
+                # search_query still holds the previous batch until the node returns
+                state = {**state, 'search_query': "; ".join(state.get('search_queries') or [])}
+            title, content = self._get_step_info(node_name, state)
+            
+            step = ThinkingStep(
+                id=f"{search_id}_{node_name}_{step_counter}",
+                type=self._STEP_TYPES[node_name],
+                status=StepStatus.RUNNING,
+                title=title,
+                content=content,
+                timestamp=datetime.utcnow()
+            )
+            
+            self.session_manager.add_step(search_id, step)
+            await self.websocket_manager.send_step_update(step, search_id)
+            
+        except Exception as e:
+            logger.error(f"Error creating running step for {node_name}: {e}")
+    
     async def _create_step(self, node_name: str, state: Dict[str, Any], search_id: str, step_counter: int):
-        """Create and broadcast a step based on node type and state."""
+        """Create and broadcast a completed step based on node type and state."""
         try:
             # Map node to step type and generate content
-            step_type = {'plan': StepType.PLAN, 'search': StepType.SEARCH, 'code': StepType.CODE, 
-                        'llm': StepType.LLM, 'solve': StepType.SOLVE, 'replan': StepType.REPLAN}.get(node_name, StepType.PLAN)
+            step_type = self._STEP_TYPES.get(node_name, StepType.PLAN)
             
-            title, content = self._get_step_info(node_name, state)
+            title, _ = self._get_step_info(node_name, state)
             metadata = self._get_metadata(node_name, state)
             
+            if node_name == 'plan':
+                # A new plan starts with empty results, its step names are reused
+                self._shown_search_results.clear()
+
+            # The node has finished when its update arrives; this replaces the
+            # running step sent for it under the same id
             step = ThinkingStep(
                 id=f"{search_id}_{node_name}_{step_counter}",
                 type=step_type,
-                status=StepStatus.RUNNING,
+                status=StepStatus.COMPLETED,
                 title=title,
-                content=content,
+                content=self._get_detailed_content(node_name, state),
                 timestamp=datetime.utcnow(),
                 metadata=metadata
             )
@@ -178,15 +224,6 @@ class DeepSearchAdapter:
             self.session_manager.add_step(search_id, step)
             await self.websocket_manager.send_step_update(step, search_id)
             
-            # Simulate processing time
-            await asyncio.sleep(1.0)
-            
-            # Update with detailed content and mark complete
-            step.content = self._get_detailed_content(node_name, state)
-            step.status = StepStatus.COMPLETED
-            self.session_manager.add_step(search_id, step)
-            await self.websocket_manager.send_step_update(step, search_id)
-            
         except Exception as e:
             logger.error(f"Error creating step for {node_name}: {e}")
             await self.websocket_manager.send_error(f"Error processing {node_name} step: {str(e)}", search_id=search_id)
@@ -194,6 +231,8 @@ class DeepSearchAdapter:
     def _get_step_info(self, node_name: str, state: Dict[str, Any]) -> tuple[str, str]:
         """Generate step title and initial content."""
         if node_name == 'plan':
+            if state.get('replan_iter', 0) > 0:
+                return 'Revising research plan', self._format_plan(state.get('plan_string', ''), state.get('steps', []))
             return 'Creating step-by-step research plan', self._format_plan(state.get('plan_string', ''), state.get('steps', []))
         elif node_name == 'search':
             query = state.get('search_query', '')
@@ -309,9 +348,12 @@ class DeepSearchAdapter:
     def _get_detailed_content(self, node_name: str, state: Dict[str, Any]) -> str:
         """Get detailed content after processing."""
         if node_name == 'plan':
+            # The plan node writes the reflection on the failed plan together with the new plan
+            reflection = state.get('reflection') if state.get('replan_iter', 0) > 0 else None
+            prefix = f"Reflection on Previous Plan:\n\n{reflection}\n\n" if reflection else ""
             steps = state.get('steps', [])
             if steps:
-                content = "Research Plan Created:\n\n"
+                content = prefix + "Research Plan Created:\n\n"
                 for i, step in enumerate(steps, 1):
                     try:
                         if isinstance(step, (list, tuple)) and len(step) >= 4:
@@ -323,26 +365,25 @@ class DeepSearchAdapter:
                         logger.error(f"Error processing detailed content step {i}: {step} - Error: {e}")
                         continue
                 return content
-            return f"Research Plan:\n\n{state.get('plan_string', 'Creating comprehensive research plan...')}"
+            return prefix + f"Research Plan:\n\n{state.get('plan_string', 'Creating comprehensive research plan...')}"
         
         elif node_name == 'search':
             search_query = state.get('search_query', '')
-            results = state.get('results', {})
-            content = f"Search Query: {search_query}\n\n"
-            if results and len(results) > 0:
-                try:
-                    results_keys = list(results.keys())
-                    if results_keys:
-                        latest_key = results_keys[-1]
-                        if latest_key and latest_key in results:
-                            result_content = str(results[latest_key])
-                            content += f"Search Results:\n{result_content}"
-                except (IndexError, KeyError, TypeError) as e:
-                    logger.error(f"Error processing search results: {e}. Results: {results}")
-                    content += "Search completed but encountered issues displaying results."
-            else:
-                content += "Gathering and processing search results..."
-            return content
+            try:
+                batch = self._new_search_results(state)
+            except (KeyError, TypeError) as e:
+                logger.error(f"Error processing search results: {e}. Results: {state.get('results')}")
+                return f"Search Query: {search_query}\n\nSearch completed but encountered issues displaying results."
+            if not batch:
+                return f"Search Query: {search_query}\n\nGathering and processing search results..."
+            if len(batch) == 1:
+                _, query, result_content = batch[0]
+                return f"Search Query: {query}\n\nSearch Results:\n{result_content}"
+            # Consecutive independent searches run as one batch, show every step of it
+            return "\n\n".join(
+                f"{step_name} Search Query: {query}\n\nSearch Results:\n{result_content}"
+                for step_name, query, result_content in batch
+            )
         
         elif node_name == 'code':
             task_query = state.get('search_query', '')
@@ -389,12 +430,26 @@ class DeepSearchAdapter:
             return content
         
         elif node_name == 'replan':
-            reflection = state.get('reflection', '')
-            return f"Reflection on Current Plan:\n\n{reflection}" if reflection else "Analyzing current progress and adjusting research strategy..."
+            # The reflection arrives with the revised plan in the next plan step
+            return "The previous plan failed. Reflecting on what it missed and creating an improved research plan..."
         
         else:
             return f"Processing {node_name} step with current state..."
     
+    def _new_search_results(self, state: Dict[str, Any]) -> list:
+        """Return (step name, query, result) of the search steps not rendered yet, in step order."""
+        results = state.get('results') or {}
+        search_steps = [
+            step[1] for step in state.get('steps', [])
+            if isinstance(step, (list, tuple)) and len(step) >= 4 and step[2] == "Search"
+        ]
+        step_names = [name for name in search_steps if name in results and name not in self._shown_search_results]
+        queries = state.get('search_queries') or []
+        if len(queries) != len(step_names):
+            queries = [state.get('search_query', '')] * len(step_names)
+        self._shown_search_results.update(step_names)
+        return [(name, query, str(results[name])) for name, query in zip(step_names, queries)]
+
     async def _handle_master_node(self, state: Dict[str, Any], search_id: str, step_counter: int):
         """Handle master node events and detect inline LLM processing."""
         try:
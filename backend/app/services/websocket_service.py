@@ -4,6 +4,12 @@ import uuid
 from datetime import datetime
 from typing import Dict, Set, Optional, List
 from fastapi import WebSocket, WebSocketDisconnect
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..models.websocket import (
     WSMessage, 
     StepUpdateMessage, 
@@ -25,6 +31,27 @@ from ..utils.logging import get_logger
 
 logger = get_logger("deepsearch.websocket")
 
+
+def _serialize_message(message: WSMessage) -> str:
+    """Serialize a message to JSON text, rendering datetimes with str()."""
+    # Convert message to dict and handle datetime serialization
+    if hasattr(message, 'model_dump'):
+        message_dict = message.model_dump()
+    else:
+        message_dict = message
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                message_dict,
+                default=str,
+                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except TypeError:
+            # e.g. keys orjson cannot coerce; json.dumps handles what it always did
+            pass
+    return json.dumps(message_dict, default=str)
+
+
 class WebSocketManager:
     """Manages WebSocket connections and message broadcasting."""
     
@@ -114,12 +141,7 @@ class WebSocketManager:
             raise WebSocketException(f"Client {client_id} not found", client_id=client_id)
         
         try:
-            # Convert message to dict and handle datetime serialization
-            if hasattr(message, 'model_dump'):
-                message_dict = message.model_dump()
-            else:
-                message_dict = message
-            await websocket.send_text(json.dumps(message_dict, default=str))
+            await websocket.send_text(_serialize_message(message))
             self._client_metadata[client_id]["last_seen"] = datetime.utcnow()
             logger.debug(f"Sent {message.type} message to client {client_id}")
         except Exception as e:
@@ -133,15 +155,12 @@ class WebSocketManager:
             return
         
         disconnected_clients = []
+        # Serialized once, every client receives the same text
+        message_text = _serialize_message(message)
         
         for client_id, websocket in self._connections.items():
             try:
-                # Convert message to dict and handle datetime serialization
-                if hasattr(message, 'model_dump'):
-                    message_dict = message.model_dump()
-                else:
-                    message_dict = message
-                await websocket.send_text(json.dumps(message_dict, default=str))
+                await websocket.send_text(message_text)
                 self._client_metadata[client_id]["last_seen"] = datetime.utcnow()
             except Exception as e:
                 logger.error(f"Failed to send message to client {client_id}: {e}")
@@ -27,7 +27,11 @@ async def solve(question: str, max_replan_iter: int = 1):
     
     start_time = time.time()
     
-    res = await graph.ainvoke({
+    # Stream state snapshots, so the plan and each intermediate result are
+    # shown as soon as they are available instead of after the final answer
+    printed_plan = None
+    printed_results = {}
+    async for res in graph.astream({
         "task": question,
         "plan_string": None,
         "steps": [],
@@ -38,18 +42,21 @@ async def solve(question: str, max_replan_iter: int = 1):
         "needs_replan": False,
         "replan_iter": 0,
         "max_replan_iter": max_replan_iter
-    }, {"recursion_limit": 30})
+    }, {"recursion_limit": 30}, stream_mode="values"):
+        if res.get("plan_string") and res["plan_string"] != printed_plan:
+            printed_plan = res["plan_string"]
+            printed_results = {}
+            print("\n===== EXECUTION PLAN =====")
+            print(printed_plan)
+        for step_name, result in (res.get("results") or {}).items():
+            if printed_results.get(step_name) != result:
+                if not printed_results:
+                    print("\n===== INTERMEDIATE RESULTS =====")
+                printed_results[step_name] = result
+                print(f"{step_name}: {result}")
     
     elapsed_time = time.time() - start_time
     
-    # Print results
-    print("\n===== EXECUTION PLAN =====")
-    print(res["plan_string"])
-    
-    print("\n===== INTERMEDIATE RESULTS =====")
-    for step_name, result in res["results"].items():
-        print(f"{step_name}: {result}")
-    
     print("\n===== FINAL ANSWER =====")
     response = res["result"]
     answer = extract_content(response, "answer")
@@ -90,21 +97,6 @@ async def interactive_mode():
             print(f"❌ Error: {e}")
 
 
-def run_async_with_cleanup(coro):
-    """Run async coroutine with proper cleanup to prevent transport errors."""
-    loop = asyncio.get_event_loop()
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        # Cancel all pending tasks and close loop properly
-        pending = asyncio.all_tasks(loop=loop)
-        for task in pending:
-            task.cancel()
-        if pending:
-            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
-        loop.close()
-
-
 def check_environment():
     """Check if required environment variables are set."""
     required_vars = ["GOOGLE_API_KEY", "WEB_SEARCH_API_KEY"]
@@ -162,14 +154,6 @@ async def main():
 
 
 if __name__ == "__main__": 
-    loop = asyncio.get_event_loop()
-    try:
-        loop.run_until_complete(main())
-    finally:
-        # Cancel all pending tasks and close loop properly
-        pending = asyncio.all_tasks(loop=loop)
-        for task in pending:
-            task.cancel()
-        if pending:
-            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
-        loop.close()
+    # asyncio.run cancels pending tasks and shuts down async generators and
+    # the default executor before closing the loop
+    asyncio.run(main())
@@ -1,32 +1,44 @@
+import asyncio
 import os
 import re
-from typing import Annotated, Sequence, TypedDict, List, Literal, Dict, Optional, Any
+import sys
+from functools import lru_cache
+from typing import Annotated, Sequence, TypedDict, List, Literal, Dict, Optional, Any, Tuple
 
-from langchain_experimental.utilities import PythonREPL
 from langchain_core.messages import AnyMessage, HumanMessage, SystemMessage
 from langchain_core.language_models import BaseLanguageModel
 from langgraph.graph import END, START, StateGraph, add_messages
 from langgraph.types import Command
 
-from .web_search.context_builder import build_context
+from .semantic_cache import SemanticCache
+from .web_search.context_builder import build_context, extractive_summary
+from .web_search.jina_reranker import JinaReranker
+from .web_search.search_cache import SearchCache
 from .web_search.serp_search import create_search_api
 from .web_search.source_processor import SourceProcessor
 from .prompt import (
-    PLAN_SYSTEM_PROMPT,
-    SOLVER_PROMPT,
-    SUMMARY_INSTRUCTION,
-    QA_PROMPT,
+    PLAN_SCHEMA,
+    PromptName,
+    build_plan_system_prompt,
     CODE_SYSTEM_PROMPT,
-    CODE_INSTRUCTION,
-    REPLAN_INSTRUCTION,
-    REFLECTION_INSTRUCTION,
-    QUESTION_REWORD_INSTRUCTION,
-    COMMONSENSE_INSTRUCTION,
-    EXPLANATION_ANSWER
-,
+    COMMONSENSE_SYSTEM,
+    SOLVER_SYSTEM,
+    EXPLANATION_SYSTEM,
+    SUMMARY_SYSTEM,
+    QUESTION_REWORD_SYSTEM,
+    render_qa,
+    render_reflect_and_replan,
+    render_reflect_and_replan_json,
+    render_commonsense,
+    render_solver,
+    render_explanation,
+    render_summary,
+    render_code,
+    render_question_reword,
 )
-from .utils import extract_content, remove_think_cot
+from .utils import extract_content, fix_answer_tag, remove_think_cot
 from dotenv import load_dotenv
+from loguru import logger
 
 # Load environment variables
 load_dotenv()
@@ -37,8 +49,21 @@ GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 OPENAI_API_KEY = os.getenv("LAMBDA_API_KEY")
 OPENAI_API_BASE_URL = "https://api.lambda.ai/v1"
 MAX_SOURCES_PER_SEARCH = int(os.getenv("MAX_SOURCES_PER_SEARCH", "2"))
+PLAN_CACHE_THRESHOLD = os.getenv("PLAN_CACHE_THRESHOLD")
+QUERY_CACHE_THRESHOLD = os.getenv("QUERY_CACHE_THRESHOLD")
+SEARCH_CACHE_PATH = os.getenv("SEARCH_CACHE_PATH")
+SEARCH_CACHE_TTL = int(os.getenv("SEARCH_CACHE_TTL", str(24 * 3600)))
+PLAN_PROMPT_EXAMPLES = os.getenv("PLAN_PROMPT_EXAMPLES", "compact")
+PLAN_OUTPUT_FORMAT = os.getenv("PLAN_OUTPUT_FORMAT", "text")
+SUMMARY_MODE = os.getenv("SUMMARY_MODE", "llm")
+CODE_TIMEOUT = int(os.getenv("CODE_TIMEOUT", "60"))
 
 # Constants
+PLAN_PROMPT_FORMAT = PromptName.PLAN_OUTPUT_JSON if PLAN_OUTPUT_FORMAT == "json" else PromptName.PLAN_OUTPUT_TEXT
+MIN_EXTRACTIVE_SUMMARY_LENGTH = 40
+# Inputs that are already well-formed questions skip the LLM rewording
+SEARCHABLE_QUESTION_PATTERN = re.compile(r"^(what|who|when|where|why|how|which|is|are|does|do)\b.*\?$", re.IGNORECASE | re.DOTALL)
+PYTHON_BLOCK_PATTERN = re.compile(r"```(?:python)?\s*([\s\S]*?)```")
 REGEX_PATTERN = r"Plan:\s*(.+)\s*(#E\d+)\s*=\s*(\w+)\s*\[([^\]]+)\]"
 
 
@@ -53,6 +78,7 @@ class ReWOOState(TypedDict):
     result: str
     intermediate_result: str
     search_query: str
+    search_queries: List[str]
     needs_replan: bool
     replan_iter: int
     max_replan_iter: int
@@ -129,14 +155,58 @@ PLAN_MODEL = MODELS["plan"]
 COMMON_MODEL = MODELS["common"]
 CODE_MODEL = MODELS["code"]
 
+# Plan model constrained to PLAN_SCHEMA, used when PLAN_OUTPUT_FORMAT is "json"
+if PLAN_OUTPUT_FORMAT == "json":
+    if OPENAI_API_KEY:
+        PLAN_JSON_MODEL = PLAN_MODEL.with_structured_output(PLAN_SCHEMA, method="json_schema", strict=True)
+    else:
+        PLAN_JSON_MODEL = PLAN_MODEL.with_structured_output(PLAN_SCHEMA)
+else:
+    PLAN_JSON_MODEL = None
+
 # Determine reranker type based on environment
 if os.getenv("RERANKER_SERVER_HOST_IP") and os.getenv("RERANKER_SERVER_PORT"):
     RERANKER_TYPE = "local"
 else:
     RERANKER_TYPE = "jina"
 
-# Warning: This executes code locally, which can be unsafe when not sandboxed
-PY_REPL = PythonREPL()
+# Semantic cache of plans for near-duplicate tasks, enabled by setting PLAN_CACHE_THRESHOLD
+if PLAN_CACHE_THRESHOLD:
+    PLAN_CACHE = SemanticCache(JinaReranker()._get_embeddings, threshold=float(PLAN_CACHE_THRESHOLD))
+else:
+    PLAN_CACHE = None
+
+# Semantic caches of reworded queries and search summaries for paraphrased
+# tool inputs, enabled by setting QUERY_CACHE_THRESHOLD (e.g. 0.95)
+if QUERY_CACHE_THRESHOLD:
+    _query_embedder = JinaReranker()._get_embeddings
+    REWORD_CACHE = SemanticCache(_query_embedder, threshold=float(QUERY_CACHE_THRESHOLD))
+    SUMMARY_CACHE = SemanticCache(_query_embedder, threshold=float(QUERY_CACHE_THRESHOLD))
+else:
+    REWORD_CACHE = None
+    SUMMARY_CACHE = None
+
+# Persistent cache of raw search API results, enabled by setting SEARCH_CACHE_PATH
+if SEARCH_CACHE_PATH:
+    SEARCH_CACHE = SearchCache(SEARCH_CACHE_PATH, max_age_seconds=SEARCH_CACHE_TTL)
+else:
+    SEARCH_CACHE = None
+
+
+@lru_cache(maxsize=None)
+def get_search_client():
+    """Return the shared search API client, created on first use."""
+    return create_search_api(
+        search_provider="serper",
+        serper_api_key=WEB_SEARCH_API_KEY,
+        search_cache=SEARCH_CACHE
+    )
+
+
+@lru_cache(maxsize=None)
+def get_source_processor(reranker: str) -> SourceProcessor:
+    """Return the shared source processor of a reranker type, created on first use."""
+    return SourceProcessor(reranker=reranker)
 
 
 def extract_last_python_block(input_str: str) -> Optional[str]:
@@ -150,16 +220,20 @@ def extract_last_python_block(input_str: str) -> Optional[str]:
         The last Python block found or None if no blocks found
     """
     # Find all code blocks that might contain python
-    py_blocks = re.findall(r'```(?:python)?\s*([\s\S]*?)```', input_str)
+    py_blocks = PYTHON_BLOCK_PATTERN.findall(input_str)
 
     if not py_blocks:
         return None
     return py_blocks[-1].strip()
 
 
-def python_repl_tool(code: str) -> Optional[str]:
+async def python_repl_tool(code: Optional[str]) -> Optional[str]:
     """
-    Execute Python code in a REPL environment.
+    Execute Python code in a separate Python process.
+    
+    Each call gets its own interpreter, so its stdout and variables are never
+    shared with the agent process or with concurrent runs.
+    Warning: This executes code locally, which can be unsafe when not sandboxed.
     
     Args:
         code: Python code to execute
@@ -167,15 +241,32 @@ def python_repl_tool(code: str) -> Optional[str]:
     Returns:
         Output of the code execution or None if execution failed
     """
+    if not code:
+        print("Failed to execute. Error: no code to run")
+        return None
     try:
-        result = PY_REPL.run(code)
-        return result
-    except BaseException as e:
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "-c", code,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=CODE_TIMEOUT)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            print(f"Failed to execute. Error: timed out after {CODE_TIMEOUT} seconds")
+            return None
+    except Exception as e:
         print(f"Failed to execute. Error: {repr(e)}")
         return None
+    if process.returncode != 0:
+        print(f"Failed to execute. Error: {stderr.decode(errors='replace').strip()}")
+        return None
+    return stdout.decode(errors="replace")
 
 
-def reword_tool_input(tool_input: str) -> str:
+async def reword_tool_input(tool_input: str) -> str:
     """
     Reword a tool input to make it more suitable for search.
     
@@ -183,14 +274,108 @@ def reword_tool_input(tool_input: str) -> str:
         tool_input: Original tool input text
         
     Returns:
-        Reworded search query
+        Reworded search query, or the original input if rewording failed
+    """
+    if SEARCHABLE_QUESTION_PATTERN.match(tool_input.strip()):
+        return tool_input
+
+    input_embedding = None
+    if REWORD_CACHE is not None:
+        reworded = REWORD_CACHE.get_exact(tool_input)
+        if reworded is not None:
+            print(f"Reworded query cache hit: {reworded}")
+            return reworded
+        # The cache only saves work, so an embedding failure counts as a miss
+        try:
+            input_embedding = await asyncio.to_thread(REWORD_CACHE.embed, tool_input)
+            reworded = REWORD_CACHE.get(input_embedding)
+        except Exception as e:
+            print(f"Reword cache lookup failed, treating as a miss. Error: {repr(e)}")
+            input_embedding = None
+            reworded = None
+        if reworded is not None:
+            print(f"Reworded query cache hit: {reworded}")
+            return reworded
+
+    prompt = render_question_reword(tool_input=tool_input)
+    response = await COMMON_MODEL.ainvoke([SystemMessage(QUESTION_REWORD_SYSTEM), HumanMessage(prompt)])
+    reworded = extract_content(response.content, "reworded_query") or tool_input
+
+    if input_embedding is not None:
+        REWORD_CACHE.set(input_embedding, reworded, text=tool_input)
+    return reworded
+
+
+def format_plan(steps: List[Tuple[str, str, str, str]]) -> str:
+    """
+    Render structured plan steps in the textual plan format.
+    
+    Args:
+        steps: List of (plan, variable, tool, tool input) tuples
+        
+    Returns:
+        Plan string that REGEX_PATTERN parses back into the same steps
     """
-    prompt = QUESTION_REWORD_INSTRUCTION.format(tool_input=tool_input)
-    response = COMMON_MODEL.invoke(prompt)
-    return extract_content(response.content.strip(), "reworded_query")
+    return "\n".join(
+        f"Plan: {step_plan}\n{step_name} = {tool}[{tool_input}]"
+        for step_plan, step_name, tool, tool_input in steps
+    )
+
+
+def parse_plan_json(plan_json: Any) -> Optional[List[Tuple[str, str, str, str]]]:
+    """
+    Convert the structured plan output into plan steps.
+    
+    Args:
+        plan_json: Output of the structured plan model, None when the model did
+            not return a tool call
+        
+    Returns:
+        List of (plan, variable, tool, tool input) tuples, or None if the output
+        is missing or does not match PLAN_SCHEMA
+    """
+    if not isinstance(plan_json, dict) or not isinstance(plan_json.get("steps"), list):
+        return None
+    steps = []
+    for step in plan_json["steps"]:
+        if not isinstance(step, dict):
+            return None
+        fields = tuple(step.get(key) for key in ("plan", "var", "tool", "input"))
+        if not all(isinstance(field, str) for field in fields):
+            return None
+        steps.append(fields)
+    return steps or None
+
+
+def pending_batch(state: ReWOOState, tool: str) -> List[str]:
+    """
+    Collect the tool inputs of the next pending steps that can run concurrently.
+    
+    Starting at the current step, consecutive steps using the same tool are
+    batched as long as their input does not reference the evidence of an
+    earlier step in the same batch.
+    
+    Args:
+        state: Current agent state
+        tool: Tool name of the current step
+        
+    Returns:
+        Tool inputs of the batched steps, with known evidence substituted
+    """
+    result_dict = state["results"]
+    batch_names = []
+    batch_inputs = []
+    for _, step_name, step_tool, tool_input in state["steps"][len(result_dict):]:
+        if step_tool != tool or any(name in tool_input for name in batch_names):
+            break
+        for k, v in result_dict.items():
+            tool_input = tool_input.replace(k, v)
+        batch_names.append(step_name)
+        batch_inputs.append(tool_input)
+    return batch_inputs
 
 
-def master(state: ReWOOState) -> Command[Literal["plan", "search", "code", "solve", "replan", END]]:
+async def master(state: ReWOOState) -> Command[Literal["plan", "search", "code", "solve", "replan", END]]:
     """
     Main decision-making node that determines the next step in the workflow.
     
@@ -237,7 +422,7 @@ def master(state: ReWOOState) -> Command[Literal["plan", "search", "code", "solv
     _, step_name, tool, tool_input = state["steps"][current_step]
     result_dict = state["results"]
 
-    print("\n======RESULT DICTIONARY=======\n", result_dict)
+    logger.debug("======RESULT DICTIONARY=======\n{}", result_dict)
 
     # Replace all occurrences of that k in the current tool_input string with v
     for k, v in result_dict.items():
@@ -245,10 +430,9 @@ def master(state: ReWOOState) -> Command[Literal["plan", "search", "code", "solv
 
     # Route to appropriate tool
     if tool == "Search":
-        searchable_query = reword_tool_input(tool_input)
         return Command(
             goto="search",
-            update={"search_query": searchable_query}
+            update={"search_queries": pending_batch(state, "Search")}
         )
     if tool == "Code":
         return Command(
@@ -256,20 +440,25 @@ def master(state: ReWOOState) -> Command[Literal["plan", "search", "code", "solv
             update={"search_query": tool_input}
         )
     if tool == "LLM":
-        prompt = COMMONSENSE_INSTRUCTION.format(question=tool_input)
-        response = PLAN_MODEL.invoke([HumanMessage(prompt)])
-        response = response.content.strip()
-        result = extract_content(response, "answer")
-        print("=========LLM TOOL RESPONSE=========\n", response)
-        if "<replan>" in response:
-            return Command(
-                goto="master",
-                update={"needs_replan": True}
-            )
-
-        if result is None:
-            result = response
-        result_dict[step_name] = str(result)
+        # Independent LLM steps are sent as concurrent requests, one per step
+        responses = await PLAN_MODEL.abatch([
+            [SystemMessage(COMMONSENSE_SYSTEM), HumanMessage(render_commonsense(question=question))]
+            for question in pending_batch(state, "LLM")
+        ])
+        for offset, response in enumerate(responses):
+            response = fix_answer_tag(response.content.strip())
+            result = extract_content(response, "answer")
+            logger.debug("=========LLM TOOL RESPONSE=========\n{}", response)
+            if "<replan>" in response:
+                return Command(
+                    goto="master",
+                    update={"needs_replan": True}
+                )
+
+            if result is None:
+                result = response
+            _, step_name, _, _ = state["steps"][current_step + offset]
+            result_dict[step_name] = str(result)
 
     return Command(
         goto="master",
@@ -277,9 +466,9 @@ def master(state: ReWOOState) -> Command[Literal["plan", "search", "code", "solv
     )
 
 
-def replan(state: ReWOOState) -> Command[Literal["plan"]]:
+async def replan(state: ReWOOState) -> Command[Literal["plan"]]:
     """
-    Generate a reflection on the current plan and prepare for replanning.
+    Prepare for replanning; the plan node reflects and replans in one call.
     
     This node is called when:
     1. "<replan>" is detected in LLM response
@@ -294,15 +483,6 @@ def replan(state: ReWOOState) -> Command[Literal["plan"]]:
     """
     print("=========REPLAN NODE=========")
     
-    # Generate reflection if it doesn't exist
-    if not state.get("reflection"):
-        reflection_prompt = REFLECTION_INSTRUCTION.format(task=state["task"], prev_plan=state["plan_string"])
-        reflection_response = PLAN_MODEL.invoke([HumanMessage(reflection_prompt)])
-        reflection = reflection_response.content.strip()
-        print("=========REFLECTION=========\n", reflection)
-    else:
-        reflection = state["reflection"]
-    
     # Update replan state
     replan_iter = state.get("replan_iter", 0) + 1
     
@@ -310,13 +490,12 @@ def replan(state: ReWOOState) -> Command[Literal["plan"]]:
         goto="plan",
         update={
             "needs_replan": True, 
-            "reflection": reflection,
             "replan_iter": replan_iter
         }
     )
 
 
-def plan(state: ReWOOState) -> Command[Literal["master"]]:
+async def plan(state: ReWOOState) -> Command[Literal["master"]]:
     """
     Generate a plan for solving the task.
     
@@ -328,25 +507,81 @@ def plan(state: ReWOOState) -> Command[Literal["master"]]:
     """
     task = state["task"]
 
-    # Choose the appropriate prompt based on whether we're replanning
-    if not state["needs_replan"]:
-        prompt = QA_PROMPT.format(task=task)
-    else:
-        prompt = REPLAN_INSTRUCTION.format(
-            task=task, prev_plan=state["plan_string"], reflection=state["reflection"])
-
-    # Generate the plan
-    result = PLAN_MODEL.invoke(
-        [SystemMessage(PLAN_SYSTEM_PROMPT), HumanMessage(prompt)])
-    
-    result.content = remove_think_cot(result.content)
-    print("==========PLAN==========\n", result.content)
-
-    # Parse plan steps
-    matches = re.findall(REGEX_PATTERN, result.content)
+    # Reuse the plan of a near-duplicate task when the semantic cache is enabled
+    task_embedding = None
+    plan_string = None
+    steps = None
+    reflection = None
+    if PLAN_CACHE is not None and not state["needs_replan"]:
+        # The cache only saves work, so an embedding failure counts as a miss
+        try:
+            task_embedding = await asyncio.to_thread(PLAN_CACHE.embed, task)
+            plan_string = PLAN_CACHE.get(task_embedding)
+        except Exception as e:
+            print(f"Plan cache lookup failed, treating as a miss. Error: {repr(e)}")
+            task_embedding = None
+            plan_string = None
+        if plan_string is not None:
+            print("Reusing cached plan for a similar task")
+
+    if plan_string is None:
+        # Choose the appropriate prompt based on whether we're replanning
+        if not state["needs_replan"]:
+            prompt = render_qa(task=task)
+        elif PLAN_JSON_MODEL is not None:
+            # Reflection and the new plan come back in a single structured output
+            prompt = render_reflect_and_replan_json(task=task, prev_plan=state["plan_string"])
+        else:
+            # Reflection and the new plan come back in a single completion
+            prompt = render_reflect_and_replan(task=task, prev_plan=state["plan_string"])
+
+        # Generate the plan
+        # Rendered per request (cached per day) so a long-running server never sends a stale date
+        plan_prompt = build_plan_system_prompt(
+            full_examples=PLAN_PROMPT_EXAMPLES == "full",
+            output_format=PLAN_PROMPT_FORMAT
+        )
+        messages = [SystemMessage(plan_prompt), HumanMessage(prompt)]
+        if PLAN_JSON_MODEL is not None:
+            try:
+                plan_json = await PLAN_JSON_MODEL.ainvoke(messages)
+            except Exception as e:
+                print(f"Structured plan output failed. Error: {repr(e)}")
+                plan_json = None
+            steps = parse_plan_json(plan_json)
+            if steps is not None:
+                plan_string = format_plan(steps)
+                if state["needs_replan"]:
+                    reflection = plan_json.get("reflection") or None
+                    print("=========REFLECTION=========\n", reflection)
+            else:
+                # Function calling may return no tool call at all, retry with the text plan format
+                print("Structured plan output missing or malformed, falling back to the text plan format")
+                plan_prompt = build_plan_system_prompt(
+                    full_examples=PLAN_PROMPT_EXAMPLES == "full",
+                    output_format=PromptName.PLAN_OUTPUT_TEXT
+                )
+                if state["needs_replan"]:
+                    prompt = render_reflect_and_replan(task=task, prev_plan=state["plan_string"])
+                messages = [SystemMessage(plan_prompt), HumanMessage(prompt)]
+        if steps is None:
+            result = await PLAN_MODEL.ainvoke(messages)
+            plan_string = remove_think_cot(result.content)
+            if state["needs_replan"]:
+                reflection = extract_content(plan_string, "reflection")
+                print("=========REFLECTION=========\n", reflection)
+                plan_string = extract_content(plan_string, "plan") or plan_string
+        if task_embedding is not None:
+            PLAN_CACHE.set(task_embedding, plan_string)
+
+    print("==========PLAN==========\n", plan_string)
+
+    # Parse plan steps unless the model already returned them structured
+    if steps is None:
+        steps = re.findall(REGEX_PATTERN, plan_string)
 
     # Update state with plan
-    update_dict = {"steps": matches, "plan_string": result.content}
+    update_dict = {"steps": steps, "plan_string": plan_string}
     if state["needs_replan"]:
         # Clean old states when replanning
         extra_dict = {
@@ -356,7 +591,8 @@ def plan(state: ReWOOState) -> Command[Literal["master"]]:
             "result": None,
             "intermediate_result": None,
             "search_query": None,
-            "reflection": None
+            "search_queries": None,
+            "reflection": reflection
         }
         update_dict.update(extra_dict)
 
@@ -366,39 +602,51 @@ def plan(state: ReWOOState) -> Command[Literal["master"]]:
     )
 
 
-async def search(state: ReWOOState) -> Command[Literal["master", "replan"]]:
+async def search_and_summarize(query: str) -> Optional[Tuple[str, List]]:
     """
-    Perform web search based on the query and process the results.
+    Perform a web search for one query and summarize the results.
 
     Args:
-        state: The current agent state
+        query: The search query
 
     Returns:
-        Command to navigate back to the master node with search results
-        or to the replan node if results are unsatisfactory
+        Tuple of (summarized answer, processed organic sources), or None if the
+        search failed or the results were unsatisfactory
     """
-    print("\n========= SEARCH NODE =========\n")
-    query = state["search_query"]
     print(f"🔍 Searching for: {query}")
+    if not query.strip():
+        print("ERROR: Search query cannot be empty")
+        return None
 
-    # Initialize search client
-    serp_search_client = create_search_api(
-        search_provider="serper",
-        serper_api_key=WEB_SEARCH_API_KEY
-    )
+    query_embedding = None
+    if SUMMARY_CACHE is not None:
+        cached = SUMMARY_CACHE.get_exact(query)
+        if cached is not None:
+            print("✅ Search summary cache hit")
+            return cached
+        # The cache only saves work, so an embedding failure counts as a miss
+        try:
+            query_embedding = await asyncio.to_thread(SUMMARY_CACHE.embed, query)
+            cached = SUMMARY_CACHE.get(query_embedding)
+        except Exception as e:
+            print(f"Search summary cache lookup failed, treating as a miss. Error: {repr(e)}")
+            query_embedding = None
+            cached = None
+        if cached is not None:
+            print("✅ Search summary cache hit")
+            return cached
+
+    serp_search_client = get_search_client()
 
     # Get and process sources
     print("🌐 Getting sources from search API")
-    sources_result = serp_search_client.get_sources(query)
+    sources_result = await asyncio.to_thread(serp_search_client.get_sources, query)
 
     # Validate search result
     if (not sources_result) or getattr(sources_result, "failed", False) or (not getattr(sources_result, "data", None)):
         error_message = getattr(sources_result, "error", "Unknown error from search provider")
         print(f"ERROR: Search API failed or returned no data - {error_message}")
-        return Command(
-            goto="master",
-            update={"needs_replan": True}
-        )
+        return None
 
     sources_data = sources_result.data
 
@@ -409,7 +657,7 @@ async def search(state: ReWOOState) -> Command[Literal["master", "replan"]]:
     else:
         print("No organic search results found")
 
-    source_processor = SourceProcessor(reranker=RERANKER_TYPE)
+    source_processor = get_source_processor(RERANKER_TYPE)
 
     print("Processing sources and building context...")
     max_sources = MAX_SOURCES_PER_SEARCH
@@ -425,48 +673,99 @@ async def search(state: ReWOOState) -> Command[Literal["master", "replan"]]:
     context = build_context(processed_sources)
     print(f"📝 Context built with {len(context)} characters")
 
+    # Try a cheap extractive summary first, falling back to the LLM on low recall
+    if SUMMARY_MODE == "extractive":
+        result = extractive_summary(context, query)
+        if len(result) >= MIN_EXTRACTIVE_SUMMARY_LENGTH:
+            print("✅ Search completed successfully (extractive summary)")
+            outcome = result, processed_sources.get('organic', [])
+            if query_embedding is not None:
+                SUMMARY_CACHE.set(query_embedding, outcome, text=query)
+            return outcome
+        print("⚠️  Extractive summary too short, falling back to LLM summary")
+
     # Generate summary of search results
-    prompt = SUMMARY_INSTRUCTION.format(
-        task=query, context=context
-    )
+    prompt = render_summary(context=context, task=query)
     summary_messages = [
+        SystemMessage(SUMMARY_SYSTEM),
         HumanMessage(prompt)
     ]
 
     print("🤖 Generating search summary...")
-    ai_message = COMMON_MODEL.invoke(summary_messages)
-    response = ai_message.content.strip()
+    ai_message = await COMMON_MODEL.ainvoke(summary_messages)
+    response = fix_answer_tag(ai_message.content.strip())
     result = extract_content(response, "answer")
 
     # Check if results are satisfactory
     if result is None:
-        result = response
         print("⚠️  Search results were not satisfactory, triggering replan")
-        print("\n======NOT SATISFACTORY RESULT=======\n", result)
+        logger.debug("======NOT SATISFACTORY RESULT=======\n{}", response)
+        return None
+
+    print("✅ Search completed successfully")
+    outcome = result, processed_sources.get('organic', [])
+    if query_embedding is not None:
+        SUMMARY_CACHE.set(query_embedding, outcome, text=query)
+    return outcome
+
+
+async def search(state: ReWOOState) -> Command[Literal["master", "replan"]]:
+    """
+    Perform web searches for a batch of independent steps and process the results.
+
+    The queries are reworded, searched and summarized concurrently, so the
+    latency of the batch is that of its slowest query.
+
+    Args:
+        state: The current agent state
+
+    Returns:
+        Command to navigate back to the master node with search results
+        or to the replan node if results are unsatisfactory
+    """
+    print("\n========= SEARCH NODE =========\n")
+    # A blank query fails its search and discards the whole batch, so replan
+    # before paying for any rewording, embedding or search
+    if not all(q.strip() for q in state["search_queries"]):
+        print("ERROR: Empty search query, replanning...")
+        return Command(
+            goto="master",
+            update={"needs_replan": True}
+        )
+
+    queries = await asyncio.gather(*(reword_tool_input(q) for q in state["search_queries"]))
+    outcomes = await asyncio.gather(*(search_and_summarize(q) for q in queries))
+
+    if any(outcome is None for outcome in outcomes):
         return Command(
             goto="master",
             update={"needs_replan": True}
         )
 
-    print("✅ Search completed successfully")
     print("Search completed, returning to master")
 
-    # Update results with search output
+    # Update results with search output, in step order
     current_step = len(state["results"])
-    _, step_name, _, _ = state["steps"][current_step]
     result_dict = state["results"]
-    result_dict[step_name] = result
+    sources = []
+    for offset, (result, organic_sources) in enumerate(outcomes):
+        _, step_name, _, _ = state["steps"][current_step + offset]
+        result_dict[step_name] = result
+        sources.extend(organic_sources)
 
     return Command(
         goto="master",
         update={
             "results": result_dict,
-            "sources": processed_sources.get('organic', [])
+            "sources": sources,
+            "search_query": "; ".join(queries),
+            # Reworded queries of the batch, in step order
+            "search_queries": list(queries)
         }
     )
 
 
-def code(state: ReWOOState) -> Command[Literal["master", "replan"]]:
+async def code(state: ReWOOState) -> Command[Literal["master", "replan"]]:
     """
     Generate and execute code based on the task.
     
@@ -478,14 +777,14 @@ def code(state: ReWOOState) -> Command[Literal["master", "replan"]]:
         or to the replan node if code execution failed
     """
     query = state["search_query"]
-    ai_message = CODE_MODEL.invoke([
+    ai_message = await CODE_MODEL.ainvoke([
         SystemMessage(CODE_SYSTEM_PROMPT),
-        HumanMessage(CODE_INSTRUCTION.format(task=query))
+        HumanMessage(render_code(task=query))
     ])
 
     code_solution = extract_last_python_block(ai_message.content)
-    print(f"Code solution:\n{code_solution}")
-    result = python_repl_tool(code_solution)
+    logger.debug("Code solution:\n{}", code_solution)
+    result = await python_repl_tool(code_solution)
 
     # Time to replan if code execution failed
     if result is None:
@@ -507,7 +806,7 @@ def code(state: ReWOOState) -> Command[Literal["master", "replan"]]:
     )
 
 
-def solve(state: ReWOOState) -> Command[Literal["master"]]:
+async def solve(state: ReWOOState) -> Command[Literal["master"]]:
     """
     Generate the final solution based on all collected results.
     
@@ -527,15 +826,18 @@ def solve(state: ReWOOState) -> Command[Literal["master"]]:
         plan += f"Plan: {step_plan}\n{step_name} = {tool}[{tool_input}]"
     
     # Generate final solution
-    prompt = SOLVER_PROMPT.format(plan=plan, task=state["task"])
-    result = PLAN_MODEL.invoke(prompt)
-    explaination = COMMON_MODEL.invoke(EXPLANATION_ANSWER.format(plan=plan, result=result.content, task=state["task"]))
+    prompt = render_solver(plan=plan, task=state["task"])
+    result = await PLAN_MODEL.ainvoke([SystemMessage(SOLVER_SYSTEM), HumanMessage(prompt)])
+    explaination = await COMMON_MODEL.ainvoke([
+        SystemMessage(EXPLANATION_SYSTEM),
+        HumanMessage(render_explanation(task=state["task"], result=result.content, plan=plan))
+    ])
 
 
     return Command(
         goto="master",
         update={
-            "result": result.content,
+            "result": fix_answer_tag(result.content),
             "explaination": explaination.content
         }
     )
@@ -1,318 +1,247 @@
-from .utils import get_current_date
-
-PLAN_SYSTEM_PROMPT = f"""\
-You are an AI agent who makes step-by-step plans to solve problems using external tools. 
-You have the ability of all knowledge in the world and are not limited to any specific timeline, you can search for information from any time period. 
-You have access to current information and can search for any recent or past events and data. Today's date is {get_current_date()}.
-
-For each step, make one plan followed by one tool-call, which will be executed later to retrieve evidence.
-Store each evidence in a distinct variable #E1, #E2, #E3... that can be referenced in subsequent tool calls.
-
-### CRITICAL RULES ###
-1. NEVER use factual knowledge directly - no dates, numbers, measurements, names, etc.
-2. ALWAYS search for ALL information, even if you think you know it
-3. Tool inputs must ONLY be search queries or #E variable references
-4. Treat yourself as having ZERO world knowledge
-
-### AVAILABLE TOOLS ###
-Search[input]: Searches the web for information. Input should be a search query.
-
-Code[input]: Executes Python code for calculations. Accepts EITHER:
-- Direct expressions: Code[#E1 * #E2 - #E3]
-- Natural language with #E references: Code[multiply the value from #E1 by the value from #E2, then subtract the value from #E3]
-NEVER include actual numbers or values - only #E references.
-
-LLM[input]: Analyzes and extracts information from previous results. Include "given #E" references.
-
-### OUTPUT FORMAT ###
-Plan: <describe your plan>
-#E1 = <tool>[<input>]
-Plan: <describe next plan>
-#E2 = <tool>[<input with #E1 reference if needed>]
-
-### VALIDATION CHECKLIST ###
-Before each step, verify:
-- No hardcoded facts in tool inputs
-- All numbers/dates come from Search results  
-- Code uses only #E references (either in expressions or natural language)
-
-### REMEMBER ###
-- Every fact must be searched
-- Code inputs use only #E references  
-- No assumptions about the world
-
-### EXAMPLES ###
-
-==== INCORRECT APPROACH ====
-Task: Calculate the distance between bases in baseball times 2
-Plan: Calculate 90 feet times 2
-#E1 = Code[90 * 2]
-ERROR: Hardcoded "90" instead of searching for it
-
-==== CORRECT APPROACH ====
-Task: Calculate the distance between bases in baseball times 2
-Plan: Search for the distance between bases in baseball
-#E1 = Search[distance between bases in baseball]
-Plan: Calculate the distance found in #E1 multiplied by 2
-#E2 = Code[#E1 * 2]
-
-==== INCORRECT APPROACH ====
-Task: What year did the Titanic sink?
-Plan: The Titanic sank in 1912
-#E1 = LLM[The answer is 1912]
-ERROR: Used internal knowledge instead of searching
-
-==== CORRECT APPROACH ====
-Task: Who won the most recent Olympic games?
-Plan: Search for the most recent Olympic games.
-#E1 = Search[most recent Olympic games]
-Plan: Extract the winner of the most recent Olympic games from the search results.
-#E2 = LLM[who won the most recent Olympic games, given #E1]
-
-==== CORRECT APPROACH ====
-Task: Multiply the number of moons of Mars by the atomic number of gold
-Plan: Search for the number of moons of Mars
-#E1 = Search[number of moons of Mars]
-Plan: Search for the atomic number of gold
-#E2 = Search[atomic number of gold]
-Plan: Calculate the product of the two values
-#E3 = Code[multiply the value from #E1 (number of moons) by the value from #E2 (atomic number)]
-
-
-### Good Example 1:
-Task: How many meters taller is the Burj Khalifa compared to the Empire State Building?
-Plan: Search for the height of Burj Khalifa.
-#E1 = Search[height of Burj Khalifa in meters]
-Plan: Search for the height of Empire State Building.
-#E2 = Search[height of Empire State Building in meters]
-Plan: Find the difference between the height of Burj Khalifa and the height of Empire State Building.
-#E3 = Code[Difference between the two heights, given #E1 and #E2]
-
-
-### Good Example 2:
-Task: Alice David is the voice of Lara Croft in a video game developed by which company?
-Plan: Search for video games where Alice David voiced Lara Croft to identify the specific game title.
-#E1 = Search[Alice David voice of Lara Croft video game]
-Plan: Search for the developer of the video game identified in #E1.
-#E2 = Search[developer of the video game where Alice David voiced Lara Croft, given #E1]
-Plan: Extract the name of the developing company from the search results in #E2.
-#E3 = LLM[what company developed the video game where Alice David voiced Lara Croft?, given #E2]
-
-### Good Example 3:
-Task: Take the year the Berlin Wall fell, subtract the year the first iPhone was released, and divide that number by the number of original Pokémon in Generation I. What is the result?
-Plan: Find the year the Berlin Wall fell to use as the first number in the calculation.
-#E1 = Search[year Berlin Wall fell]
-Plan: Find the year the first iPhone was released to use as the second number in the calculation.
-#E2 = Search[year first iPhone released]
-Plan: Find the number of original Pokémon in Generation I to use as the divisor in the calculation.
-#E3 = Search[number of original Pokémon in Generation I]
-Plan: Calculate the result by subtracting the year the first iPhone was released from the year the Berlin Wall fell, then dividing by the number of original Pokémon in Generation I.
-#E4 = Code[#E1 - #E2) / #E3]
-
-### Good Example 4:
-Task: Thomas, Toby, and Rebecca worked a total of 157 hours in one week. Thomas worked x hours. Toby worked 10 hours less than twice what Thomas worked, and Rebecca worked 8 hours less than Toby. How many hours did Rebecca work? 
-Plan: Given Thomas worked x hours, translate the problem into algebraic expressions and solve with Code.
-#E1 = Code[Solve this equation: x + (2x - 10) + ((2x - 10) - 8) = 157]
-Plan: Find out the number of hours Thomas worked.
-#E2 = LLM[What is x, given #E1]
-Plan: Calculate the number of hours Rebecca worked.
-#E3 = Code[(2 * #E2 - 10) - 8]
-
-### Good Example 5:
-Task: What was the profession of the spouse of the author who wrote the novel that inspired the movie "Blade Runner"?
-Plan: Search for information about the movie "Blade Runner" and its source material.
-#E1 = Search[Blade Runner movie based on novel book author]
-Plan: Identify the specific novel and author from the search results.
-#E2 = LLM[What novel was the movie "Blade Runner" based on and who wrote it?, given #E1]
-Plan: Search for information about the author's spouse.
-#E3 = Search[(author from #E2) spouse wife husband married to]
-Plan: Extract the spouse's name and profession from the search results.
-#E4 = LLM[Who was (author from #E2) married to and what was their profession?, given #E3]
-
-### Good Example 6:
-Task: How many days old was Barack Obama when he won his first Grammy Award?
-Plan: Search for Barack Obama's birth date.
-#E1 = Search[Barack Obama birth date]
-Plan: Search for information about Barack Obama's Grammy Award wins.
-#E2 = Search[Barack Obama Grammy Award won when]
-Plan: Extract Barack Obama's exact birth date from the search results.
-#E3 = LLM[What is Barack Obama's exact birth date?, given #E1]
-Plan: Determine when Barack Obama won his first Grammy Award.
-#E4 = LLM[When did Barack Obama win his first Grammy Award?, given #E2]
-Plan: Calculate the number of days between his birth and his first Grammy win.
-#E5 = Code[Calculate the number of days between #E3 and #E4]
-"""
-
-REPLAN_INSTRUCTION = """
-## Task
-{task}
-
-## Previous Plan
-{prev_plan}
-
-## Reflection on the previous plan
-{reflection}
-
-Given the above task, the previous plan, and the reflection on the previous plan, please re-plan and generate a new plan based on your learning from the reflection.
-"""
-
-REFLECTION_INSTRUCTION = """\
-You are a helpful assistant who is good at reflecting on the previous plan and the task. 
-You need to find the pain points that previous plan missed which caused the plan to fail
-
-## Task
-{task}
-
-## Previous Plan
-{prev_plan}
-
-## Reflection on the previous plan
-"""
-
-COMMONSENSE_INSTRUCTION = """\
-You are a commonsense agent. You can answer the given question with logical reasoning, basic math and commonsense knowledge.
-Finally, provide your answer in the format <answer>YOUR_ANSWER</answer>.
-
-If you find that you CANT answer the question confidently, you can request a replan by writing 
-<replan>I need to replan</replan>.  
-
-## Question
-{question}
-"""
-
-SOLVER_PROMPT = """\
-You are an AI agent who solves a problem with my assistance with the help of LLM reasoning. I will provide step-by-step plans(Plan) and evidences(#E) that could be helpful.
-Your task is to briefly summarize each step, then make a short final conclusion for your task.
-Finally, provide your answer in the format <answer>YOUR_ANSWER</answer>.
-
-## My Plans and Evidences
-{plan}
-
-## Example Output
-First, I <did something> , and I think <...>; Second, I <...>, and I think <...>; ....
-So, <your conclusion>.
-The answer is <answer>YOUR_ANSWER</answer>.
-
-## Your Task
-{task}
-
-## Now Begin
-"""
-
-EXPLANATION_ANSWER = """\
-You are a helpful assistant that explains the solution to the user's query by primarily relying on the LLM's final response. 
-while using the executed plan and evidence only as supporting context. Talk to the user like you are a human.
-
-## User Query
-{task}
-
-## LLM's Final Response
-{result}
-
-## Supporting Plan and Evidence
-{plan}
-
-### Instructions:
-- The user does not understand the plan or evidence, so avoid technical jargon and explain the solution in simple, clear, and direct language.  
-- Give more weight to the LLM's final response than to the plan and evidence.
-- If the answer is clear and confident, present it in a straightforward explanation.  
-- If the evidence is weak or you are uncertain, state clearly: "I'm not confident with my response."  
-- Do not restate the plan or evidence; instead, translate it into an explanation the user can easily follow.  
-"""
-
-
-SUMMARY_INSTRUCTION = """\
-You are a helpful assistant who is good at aggregate and summarize information.
-Your task is to briefly summarize the given information, then answer the question.
-Provide your answer in the format <answer>YOUR_ANSWER</answer>.
-
-## Context
-{context}
-
-## Question
-{task}
+import sys
+from enum import Enum
+from functools import lru_cache
+from importlib.resources import files
+from string import Formatter
 
-"""
-
-QA_PROMPT = """
-## Your Task
-Task: {task}
-"""
-
-CODE_SYSTEM_PROMPT = """\
-You are an expert Python programmer with deep knowledge of algorithms, data structures, mathematics, and software engineering best practices.
-
-Your task is to write Python code that solves the given problem **and produces the final result as a printed output**. The code will be directly executed in a Python interpreter, so do not include explanations or intermediate print statements — only the final result matters.
-
-Follow these instructions strictly:
-
-1. Analyze the task and choose the most efficient and appropriate solution approach.
-2. Write clean, well-documented, and maintainable code.
-3. Structure your response with:
-   - All required imports and dependencies
-   - Complete, executable Python code with necessary variable definitions
-   - The **final output printed at the end**, using `print(...)`
-4. Handle edge cases and errors gracefully.
-5. Do not output anything other than the final code block.
-6. The output of the script should be the **final answer** to the task — no debug prints or explanations.
-
-Code best practices:
-- Use meaningful variable names.
-- Follow PEP8 style guidelines.
-- Include comments where complex logic is used.
-- Optimize for performance and clarity.
-
-Example:
+from .utils import get_current_date
+
+PROMPT_DIR = files(__package__).joinpath("prompts")
+
+
+class PromptName(Enum):
+    """Prompt templates shipped as text files in ``PROMPT_DIR``."""
+    PLAN_SYSTEM_PROMPT = "plan_system_prompt"
+    PLAN_EXAMPLES = "plan_examples"
+    PLAN_EXAMPLES_EXTRA = "plan_examples_extra"
+    PLAN_EXAMPLES_JSON = "plan_examples_json"
+    PLAN_OUTPUT_TEXT = "plan_output_text"
+    PLAN_OUTPUT_JSON = "plan_output_json"
+    PLAN_DATE = "plan_date"
+    PLAN_CHECKLIST = "plan_checklist"
+    REFLECT_AND_REPLAN_INSTRUCTION = "reflect_and_replan_instruction"
+    REFLECT_AND_REPLAN_INSTRUCTION_JSON = "reflect_and_replan_instruction_json"
+    COMMONSENSE_SYSTEM = "commonsense_system"
+    COMMONSENSE_INSTRUCTION = "commonsense_instruction"
+    SOLVER_SYSTEM = "solver_system"
+    SOLVER_PROMPT = "solver_prompt"
+    EXPLANATION_SYSTEM = "explanation_system"
+    EXPLANATION_ANSWER = "explanation_answer"
+    SUMMARY_SYSTEM = "summary_system"
+    SUMMARY_INSTRUCTION = "summary_instruction"
+    QA_PROMPT = "qa_prompt"
+    CODE_SYSTEM_PROMPT = "code_system_prompt"
+    CODE_INSTRUCTION = "code_instruction"
+    QUESTION_REWORD_SYSTEM = "question_reword_system"
+    QUESTION_REWORD_INSTRUCTION = "question_reword_instruction"
+
+
+@lru_cache(maxsize=None)
+def get_prompt(name: PromptName) -> str:
+    """Read a prompt template from disk, once per process, in canonical form.
+
+    Line endings, trailing whitespace and a BOM are normalized away so every
+    checkout and editor yields the same prompt bytes, which provider-side
+    prefix caches match exactly.
+    """
+    text = PROMPT_DIR.joinpath(f"{name.value}.txt").read_text(encoding="utf-8-sig")
+    return sys.intern("\n".join(line.rstrip() for line in text.splitlines()).strip())
+
+
+@lru_cache(maxsize=None)
+def build_plan_system_prompt_static(
+    full_examples: bool = False,
+    output_format: PromptName = PromptName.PLAN_OUTPUT_TEXT
+) -> str:
+    """Assemble the date-independent body of the plan system prompt: rules, tools, output format and examples.
+
+    The full variant is the audit baseline, so it also keeps the validation
+    checklist and reminders of the original prompt after the output format.
+    """
+    output_format_text = get_prompt(output_format)
+    if full_examples:
+        output_format_text += "\n\n" + get_prompt(PromptName.PLAN_CHECKLIST)
+    if output_format == PromptName.PLAN_OUTPUT_JSON:
+        examples = get_prompt(PromptName.PLAN_EXAMPLES_JSON)
+        if full_examples:
+            examples += (
+                "\n\nThe examples below use the textual plan format; express the same steps as JSON.\n\n"
+                + get_prompt(PromptName.PLAN_EXAMPLES_EXTRA)
+            )
+    else:
+        examples = get_prompt(PromptName.PLAN_EXAMPLES)
+        if full_examples:
+            examples += "\n\n" + get_prompt(PromptName.PLAN_EXAMPLES_EXTRA)
+    return get_prompt(PromptName.PLAN_SYSTEM_PROMPT).format(
+        output_format=output_format_text,
+        examples=examples
+    )
+
+
+def build_plan_system_prompt(
+    full_examples: bool = False,
+    output_format: PromptName = PromptName.PLAN_OUTPUT_TEXT
+) -> str:
+    """Assemble the plan system prompt.
+
+    The static body comes first verbatim and the current date is appended as a
+    short suffix, so the body stays a byte-identical prefix across days and
+    requests for provider-side prompt caching.
+    """
+    return _plan_system_prompt_for_date(get_current_date(), full_examples, output_format)
+
+
+@lru_cache(maxsize=8)
+def _plan_system_prompt_for_date(today: str, full_examples: bool, output_format: PromptName) -> str:
+    """Render the plan system prompt once per day and argument set."""
+    return (
+        build_plan_system_prompt_static(full_examples, output_format)
+        + "\n\n"
+        + get_prompt(PromptName.PLAN_DATE).format(today=today)
+    )
+
+
+# Prompt constants are built on first attribute access (PEP 562), so importing
+# the module reads no prompt files and entry points only pay for the prompts
+# they use. Static system halves (*_SYSTEM) contain no fields, so each is
+# byte-identical across requests and forms a cacheable prefix on the provider
+# side; the matching *_INSTRUCTION / *_PROMPT templates hold only the user half.
+_LAZY_CONSTANTS = {
+    # Dated when first accessed; request-time callers use build_plan_system_prompt()
+    "PLAN_SYSTEM_PROMPT": build_plan_system_prompt,
+    # Same rules with the complete worked-example set, for auditing quality regressions
+    "PLAN_SYSTEM_PROMPT_WITH_EXAMPLES": lambda: build_plan_system_prompt(full_examples=True),
+}
+for _name in (
+    "REFLECT_AND_REPLAN_INSTRUCTION",
+    "REFLECT_AND_REPLAN_INSTRUCTION_JSON",
+    "COMMONSENSE_SYSTEM",
+    "COMMONSENSE_INSTRUCTION",
+    "SOLVER_SYSTEM",
+    "SOLVER_PROMPT",
+    "EXPLANATION_SYSTEM",
+    "EXPLANATION_ANSWER",
+    "SUMMARY_SYSTEM",
+    "SUMMARY_INSTRUCTION",
+    "QA_PROMPT",
+    "CODE_SYSTEM_PROMPT",
+    "CODE_INSTRUCTION",
+    "QUESTION_REWORD_SYSTEM",
+    "QUESTION_REWORD_INSTRUCTION",
+):
+    _LAZY_CONSTANTS[_name] = lambda name=PromptName[_name]: get_prompt(name)
+del _name
+
+
+def __getattr__(name):
+    """Build a prompt constant on first access and cache it in the module namespace."""
+    try:
+        factory = _LAZY_CONSTANTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = globals()[name] = factory()
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_CONSTANTS))
+
+
+# JSON schema for structured plan output (PLAN_OUTPUT_JSON)
+PLAN_SCHEMA = {
+    "title": "plan",
+    "description": "Step-by-step plan with one tool call per step",
+    "type": "object",
+    "properties": {
+        "reflection": {
+            "type": "string",
+            "description": "Why the previous plan failed, empty when there is no previous plan"
+        },
+        "steps": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "plan": {"type": "string", "description": "Short label for the step"},
+                    "var": {"type": "string", "description": "Evidence variable, e.g. #E1"},
+                    "tool": {"type": "string", "enum": ["Search", "Code", "LLM"]},
+                    "input": {"type": "string"}
+                },
+                "required": ["plan", "var", "tool", "input"],
+                "additionalProperties": False
+            }
+        }
+    },
+    "required": ["reflection", "steps"],
+    "additionalProperties": False
+}
+
+
+# Globals for evaluating compiled templates: no builtins, so field names can
+# only resolve to the keyword arguments passed to the renderer
+_TEMPLATE_GLOBALS = {"__builtins__": {}}
+
+
+def _compile(template):
+    """Compile a ``str.format`` template into an f-string code object.
+
+    The fields become ``FORMAT_VALUE`` slots of a single f-string expression,
+    so rendering is one ``eval`` against the field values with no format-spec
+    parsing per call. ``Formatter.parse`` already unescapes ``{{``/``}}``, so
+    the literal parts are re-escaped for the f-string.
+    """
+    source = []
+    for literal, field, spec, conversion in Formatter().parse(template):
+        source.append(literal.replace("{", "{{").replace("}", "}}"))
+        if field is None:
+            continue
+        if spec or conversion or not field.isidentifier():
+            raise ValueError(f"Unsupported format field '{field}'")
+        source.append("{" + field + "}")
+    return compile("f" + repr("".join(source)), "<prompt template>", "eval")
+
+
+@lru_cache(maxsize=None)
+def _renderer(name: str):
+    """Compile the template of a ``PromptName`` member on first use.
+
+    Keyed by the member name because hashing a ``str`` is much cheaper than
+    hashing an ``Enum`` member on every render.
+    """
+    return _compile(get_prompt(PromptName[name]))
+
+
+def render_qa(task):
+    return eval(_renderer("QA_PROMPT"), _TEMPLATE_GLOBALS, locals())
 
-Task: Calculate the combined population of China and India in 2022.
 
-```python
-# Given populations in billions
-population_china_2022 = 1.412 * 10**9
-population_india_2022 = 1.417 * 10**9
+def render_reflect_and_replan(task, prev_plan):
+    return eval(_renderer("REFLECT_AND_REPLAN_INSTRUCTION"), _TEMPLATE_GLOBALS, locals())
 
-# Calculate total population
-combined_population = population_china_2022 + population_india_2022
 
-# Print final result
-print(combined_population)
-```
+def render_reflect_and_replan_json(task, prev_plan):
+    return eval(_renderer("REFLECT_AND_REPLAN_INSTRUCTION_JSON"), _TEMPLATE_GLOBALS, locals())
 
-Task: 1034 - 223 / 100
 
-```python
-# Calculate the result
-result = 1034 - 223 / 100
+def render_commonsense(question):
+    return eval(_renderer("COMMONSENSE_INSTRUCTION"), _TEMPLATE_GLOBALS, locals())
 
-# Print final result
-print(result)
-```
 
-"""
+def render_solver(plan, task):
+    return eval(_renderer("SOLVER_PROMPT"), _TEMPLATE_GLOBALS, locals())
 
-CODE_INSTRUCTION = """\
-Task: {task}
 
-Code:
+def render_explanation(task, result, plan):
+    return eval(_renderer("EXPLANATION_ANSWER"), _TEMPLATE_GLOBALS, locals())
 
-"""
 
-QUESTION_REWORD_INSTRUCTION = """
-You are a helpful assistant that rephrases text into a clear, searchable question suitable for web search.
+def render_summary(context, task):
+    return eval(_renderer("SUMMARY_INSTRUCTION"), _TEMPLATE_GLOBALS, locals())
 
-**Instructions:**
-1.  **Analyze the input:** Determine if the provided text is already a clear and searchable question.
-2.  **Reword if necessary:** If the input is unclear, fragmented, or not in the form of a question, rephrase it to be a concise and effective search query.
-3.  **Return as is:** If the input is already a good search query, return it unchanged.
-4.  **Formatting:** The reworded or original query must be delimited by `<reworded_query>...</reworded_query>`.
 
-Example:
-Input: What is the capital of France?
-Output: <reworded_query>What is the capital of France?</reworded_query>
+def render_code(task):
+    return eval(_renderer("CODE_INSTRUCTION"), _TEMPLATE_GLOBALS, locals())
 
-Input: population of China
-Output: <reworded_query>What is the population of China?</reworded_query>
 
-Input: {tool_input}
-Output:
-"""
\ No newline at end of file
+def render_question_reword(tool_input):
+    return eval(_renderer("QUESTION_REWORD_INSTRUCTION"), _TEMPLATE_GLOBALS, locals())
@@ -0,0 +1,77 @@
+from typing import Any, Callable, Dict, List, Optional
+
+import torch
+
+
+class SemanticCache:
+    """
+    In-memory semantic cache keyed on normalized text embeddings.
+
+    Lookups compute the inner product between the query embedding and every
+    cached key (equivalent to a flat inner-product index), and return the value
+    of the best match if its cosine similarity reaches the threshold. Texts
+    stored alongside their embedding can also be found by an exact lookup on
+    the normalized text, which skips the embedding request entirely.
+    """
+
+    def __init__(
+        self,
+        embedder: Callable[[List[str]], torch.Tensor],
+        threshold: float = 0.87,
+        max_entries: int = 1024
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            embedder: Callable mapping a list of texts to a (num_texts, dim) tensor,
+                e.g. ``JinaReranker()._get_embeddings``
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries: Maximum number of entries, oldest entries are evicted first
+        """
+        self.embedder = embedder
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._keys: Optional[torch.Tensor] = None
+        self._values: List[Any] = []
+        self._texts: List[Optional[str]] = []
+        self._exact: Dict[str, Any] = {}
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Lowercase the text and collapse its whitespace."""
+        return " ".join(text.lower().split())
+
+    def get_exact(self, text: str) -> Optional[Any]:
+        """Return the value stored for the same normalized text, or None on a miss."""
+        return self._exact.get(self.normalize(text))
+
+    def embed(self, text: str) -> torch.Tensor:
+        """Embed a single text and L2-normalize it."""
+        embedding = self.embedder([text])[0].float()
+        return torch.nn.functional.normalize(embedding, dim=-1)
+
+    def get(self, embedding: torch.Tensor) -> Optional[Any]:
+        """Return the cached value closest to the embedding, or None on a miss."""
+        if self._keys is None:
+            return None
+        score, index = torch.max(self._keys @ embedding, dim=0)
+        if score.item() < self.threshold:
+            return None
+        return self._values[index.item()]
+
+    def set(self, embedding: torch.Tensor, value: Any, text: Optional[str] = None) -> None:
+        """Store a value under the given embedding, and under its text if given."""
+        key = embedding.unsqueeze(0)
+        self._keys = key if self._keys is None else torch.cat([self._keys, key])
+        self._values.append(value)
+        normalized = None if text is None else self.normalize(text)
+        self._texts.append(normalized)
+        if normalized is not None:
+            self._exact[normalized] = value
+        if len(self._values) > self.max_entries:
+            self._keys = self._keys[1:]
+            self._values.pop(0)
+            evicted = self._texts.pop(0)
+            if evicted is not None and evicted not in self._texts:
+                self._exact.pop(evicted, None)
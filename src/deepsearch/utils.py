@@ -1,51 +1,80 @@
 import json
 import re
-from datetime import datetime
+from datetime import date
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# An <answer> tag that is never closed before the end of the text
+_UNCLOSED_ANSWER_RE = re.compile(r"<answer>(?:(?!</answer>).)*$", re.DOTALL)
+# Triple backtick blocks labeled as xml; DOTALL makes '.' match newlines as well
+_XML_BLOCK_RE = re.compile(r"```xml(.*?)```", re.DOTALL)
+_THINK_RE = re.compile(r"<think>.*?</think>\s*", re.DOTALL)
 
 
 def extract_plan_result(json_string):
-    data = json.loads(json_string)
-    query_list = []
-    for k, v in data.items():
-        query_list.append(v)
-    return query_list
+    # Dicts keep insertion order, so the values come out in plan order
+    if orjson is not None:
+        return list(orjson.loads(json_string).values())
+    return list(json.loads(json_string).values())
 
 
 def remove_xml_blocks(markdown_text):
-    # This pattern matches triple backtick blocks labeled as xml
-    pattern = r"```xml(.*?)```"
-    # re.DOTALL makes '.' match newlines as well
-    cleaned_text = re.sub(pattern, r"\1", markdown_text, flags=re.DOTALL)
+    cleaned_text = _XML_BLOCK_RE.sub(r"\1", markdown_text)
     return cleaned_text
 
 
 def extract_content(input_str, target_tag):
-    pattern = rf"<{target_tag}>(.*?)</{target_tag}>"
-    matches = re.findall(pattern, input_str, re.DOTALL)
-    try:
-        if not matches:
-            raise RuntimeError(f"Cannot extract '{target_tag}'!")
-        content = matches[-1].strip()
-        return content
-    except Exception as e:
-        print(e)
+    # Content of the last closed tag, located with plain substring scans: the
+    # last opening tag before the last closing tag, up to its first closing tag
+    open_tag = f"<{target_tag}>"
+    close_tag = f"</{target_tag}>"
+    end = input_str.rfind(close_tag)
+    start = input_str.rfind(open_tag, 0, end) if end != -1 else -1
+    if start == -1:
+        print(f"Cannot extract '{target_tag}'!")
         return None
+    start += len(open_tag)
+    return input_str[start:input_str.find(close_tag, start)].strip()
+
+
+def fix_answer_tag(input_str):
+    # Close a trailing <answer> tag that the model left unterminated
+    if _UNCLOSED_ANSWER_RE.search(input_str):
+        return input_str + "</answer>"
+    return input_str
 
 
 def extract_last_json_block(markdown_text):
-    # Find all code blocks that might contain JSON
-    json_blocks = re.findall(r'```(?:json)?\s*([\s\S]*?)```', markdown_text)
-    
-    if not json_blocks:
+    # Scan right to left for the fences of the last code block; with an odd
+    # number of fences the trailing one is unclosed and is skipped
+    end = markdown_text.rfind("```")
+    if markdown_text.count("```") % 2:
+        end = markdown_text.rfind("```", 0, end)
+    start = markdown_text.rfind("```", 0, end) if end > 0 else -1
+    if start == -1:
         return None
-    return json_blocks[-1].strip()
+    body = markdown_text[start + 3:end]
+    if body.startswith("json"):
+        body = body[4:]
+    return body.strip()
 
 
 def remove_think_cot(input_str):
-    cleaned_str = re.sub(r"<think>.*?</think>\s*", "", input_str, flags=re.DOTALL)
+    cleaned_str = _THINK_RE.sub("", input_str)
     return cleaned_str.strip()
 
 
+# (date ordinal, formatted date) of the last call, so formatting happens once per day
+_cached_date = (None, None)
+
+
 def get_current_date():
     """Return the current date formatted as 'Month Day, Year'"""
-    return datetime.now().strftime('%B %d, %Y')
+    global _cached_date
+    today = date.today()
+    if _cached_date[0] != today.toordinal():
+        _cached_date = (today.toordinal(), today.strftime('%B %d, %Y'))
+    return _cached_date[1]
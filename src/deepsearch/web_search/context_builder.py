@@ -3,10 +3,16 @@ Reference:
 https://github.com/sentient-agi/OpenDeepSearch/blob/main/src/opendeepsearch/context_building/build_context.py
 
 """
+import math
+import re
+from collections import Counter
 from typing import Dict, List, Optional
 
 from loguru import logger
 
+SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?])\s+|\n+")
+TOKEN_PATTERN = re.compile(r"\w+")
+
 
 def extract_information(organic_results: List[Dict]) -> List[str]:
     """Extract snippets from organic search results in a formatted string."""
@@ -99,4 +105,51 @@ def build_context(
 
     except Exception as e:
         logger.exception(f"An error occurred while building context: {e}")
-        return ""  # Return empty string in case of error
\ No newline at end of file
+        return ""  # Return empty string in case of error
+
+
+def extractive_summary(
+    context: str,
+    query: str,
+    num_sentences: int = 3,
+    k1: float = 1.5,
+    b: float = 0.75
+) -> str:
+    """
+    Summarize a context by selecting the sentences that best match the query.
+
+    Sentences are scored with BM25 against the query terms, and the top
+    sentences are returned in their original order.
+
+    Args:
+        context: Context built from search results
+        query: Query the summary should answer
+        num_sentences: Maximum number of sentences to keep
+        k1: BM25 term-frequency saturation
+        b: BM25 length normalization
+
+    Returns:
+        The selected sentences joined by spaces, or an empty string if no
+        sentence matches the query
+    """
+    sentences = [s.strip() for s in SENTENCE_SPLIT_PATTERN.split(context) if s.strip()]
+    if not sentences:
+        return ""
+
+    query_terms = set(TOKEN_PATTERN.findall(query.lower()))
+    tokenized = [TOKEN_PATTERN.findall(sentence.lower()) for sentence in sentences]
+    avg_length = sum(len(tokens) for tokens in tokenized) / len(tokenized) or 1.0
+    doc_freq = Counter(term for tokens in tokenized for term in set(tokens) & query_terms)
+
+    scores = []
+    for tokens in tokenized:
+        term_freq = Counter(tokens)
+        score = 0.0
+        for term in query_terms & term_freq.keys():
+            idf = math.log(1 + (len(sentences) - doc_freq[term] + 0.5) / (doc_freq[term] + 0.5))
+            tf = term_freq[term]
+            score += idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * len(tokens) / avg_length))
+        scores.append(score)
+
+    ranked = sorted(range(len(sentences)), key=scores.__getitem__, reverse=True)[:num_sentences]
+    return " ".join(sentences[i] for i in sorted(ranked) if scores[i] > 0)
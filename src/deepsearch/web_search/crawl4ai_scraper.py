@@ -18,7 +18,7 @@ from crawl4ai.extraction_strategy import (CosineStrategy, ExtractionStrategy,
                                           NoExtractionStrategy)
 from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
 
-from deepsearch.web_search.utils import get_wikipedia_content
+from deepsearch.web_search.utils import get_quality_model, get_wikipedia_content
 
 
 class StrategyFactory:
@@ -247,6 +247,11 @@ class WebScraper:
         Returns:
             Dictionary mapping URLs to their extraction results
         """
+        # Download and load the quality classifier in a worker thread on first use,
+        # so content filtering never blocks the event loop on it
+        if self.filter_content:
+            await asyncio.to_thread(get_quality_model)
+
         # Create tasks for all URLs
         tasks = [self.scrape(url) for url in urls]
         # Run all tasks concurrently
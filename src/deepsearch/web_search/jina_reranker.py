@@ -9,9 +9,14 @@ from typing import List, Optional
 import requests
 import torch
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
 from .base_reranker import BaseSemanticSearcher
 
+# Pooled connections, so repeated embedding requests reuse the TLS connection to the API
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=16, max_retries=0))
+
 
 class JinaReranker(BaseSemanticSearcher):
     """
@@ -59,7 +64,7 @@ class JinaReranker(BaseSemanticSearcher):
         }
         
         try:
-            response = requests.post(self.api_url, headers=self.headers, json=data)
+            response = _SESSION.post(self.api_url, headers=self.headers, json=data)
             response.raise_for_status()  # Raise exception for non-200 status codes
             
             # Extract embeddings from response
@@ -8,6 +8,11 @@ import requests
 import torch
 from typing import List, Optional, Dict, Union
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+# Pooled connections, so batches reuse the connection to the reranker server
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=16, max_retries=0))
 
 def batch_inputs(inputs, batch_size=32):
     for i in range(0, len(inputs), batch_size):
@@ -25,7 +30,7 @@ def send_batched_requests(api_url, headers, data):
         batch_data["texts"] = batch
 
         try:
-            response = requests.post(api_url, headers=headers, json=batch_data)
+            response = _SESSION.post(api_url, headers=headers, json=batch_data)
             response.raise_for_status()  # Raise exception for non-200 status codes
 
             resp_data = response.json()
@@ -0,0 +1,106 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+def _dumps(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(blob: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(blob)
+    return json.loads(blob)
+
+
+class SearchCache:
+    """
+    Persistent cache of search API results in a single SQLite database.
+
+    Entries are keyed by a hash of the request parameters and expire after
+    ``max_age_seconds``. The database runs in WAL mode so concurrent searches
+    in worker threads can read while another thread writes. Recently used
+    entries are also kept in an in-process LRU, so repeated queries within a
+    run (e.g. after a replan) never touch the database.
+    """
+
+    def __init__(self, db_path: str, max_age_seconds: int = 24 * 3600, memory_entries: int = 256):
+        """
+        Initialize the search cache.
+
+        Args:
+            db_path: Path of the SQLite database file, created if missing
+            max_age_seconds: Time to live of a cached entry
+            memory_entries: Maximum number of entries kept in the in-process LRU
+        """
+        self.db_path = db_path
+        self.max_age_seconds = max_age_seconds
+        self.memory_entries = memory_entries
+        # Maps key -> (expiry, serialized data); values are deserialized on every
+        # hit because callers mutate the returned result
+        self._memory: "OrderedDict[bytes, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key BLOB PRIMARY KEY, expiry INTEGER, data BLOB)"
+        )
+
+    @staticmethod
+    def make_key(params: Dict[str, Any]) -> bytes:
+        """Hash the request parameters into a fixed-size, non-cryptographic cache key."""
+        if xxhash is not None:
+            return xxhash.xxh3_128_digest(_dumps(params))
+        return hashlib.blake2b(_dumps(params), digest_size=16).digest()
+
+    def get(self, params: Dict[str, Any]) -> Optional[Any]:
+        """Return the cached result for the request parameters, or None on a miss or expiry."""
+        key = self.make_key(params)
+        now = int(time.time())
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and entry[0] > now:
+                self._memory.move_to_end(key)
+                return _loads(entry[1])
+            row = self._conn.execute(
+                "SELECT expiry, data FROM cache WHERE key = ? AND expiry > ?", (key, now)
+            ).fetchone()
+            if row is None:
+                return None
+            self._remember(key, row[0], row[1])
+        return _loads(row[1])
+
+    def set(self, params: Dict[str, Any], data: Any) -> None:
+        """Store the result for the request parameters."""
+        key = self.make_key(params)
+        expiry = int(time.time()) + self.max_age_seconds
+        blob = _dumps(data)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, expiry, data) VALUES (?, ?, ?)", (key, expiry, blob)
+            )
+            self._remember(key, expiry, blob)
+
+    def _remember(self, key: bytes, expiry: int, blob: bytes) -> None:
+        """Insert an entry into the in-process LRU, evicting the least recently used one."""
+        self._memory[key] = (expiry, blob)
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
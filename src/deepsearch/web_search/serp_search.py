@@ -9,10 +9,17 @@ from dataclasses import dataclass
 from typing import Any, Dict, Generic, List, Optional, TypeVar, Union
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from .search_cache import SearchCache
 
 T = TypeVar('T')
 
+# Pooled connections, so repeated searches reuse the TCP/TLS connection to the provider
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0))
+
 class SearchAPIException(Exception):
     """Custom exception for Search API related errors"""
     pass
@@ -87,11 +94,17 @@ class SearchAPI(ABC):
 
 
 class SerperAPI(SearchAPI):
-    def __init__(self, api_key: Optional[str] = None, config: Optional[SerperConfig] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        config: Optional[SerperConfig] = None,
+        cache: Optional[SearchCache] = None
+    ):
         if api_key:
             self.config = SerperConfig(api_key=api_key)
         else:
             self.config = config or SerperConfig.from_env()
+        self.cache = cache
 
         self.headers = {
             'X-API-KEY': self.config.api_key,
@@ -132,7 +145,12 @@ class SerperAPI(SearchAPI):
                 "gl": search_location
             }
 
-            response = requests.post(
+            if self.cache is not None:
+                cached = self.cache.get(payload)
+                if cached is not None:
+                    return SearchResult(data=cached)
+
+            response = _SESSION.post(
                 self.config.api_url,
                 headers=self.headers,
                 json=payload,
@@ -160,6 +178,8 @@ class SerperAPI(SearchAPI):
                 'relatedSearches': data.get('relatedSearches')
             }
 
+            if self.cache is not None:
+                self.cache.set(payload, results)
             return SearchResult(data=results)
 
         except requests.RequestException as e:
@@ -224,7 +244,7 @@ class SearXNGAPI(SearchAPI):
             if stored_location and stored_location != 'all':
                 params['language'] = stored_location
 
-            response = requests.get(
+            response = _SESSION.get(
                 search_url,
                 headers=self.headers,
                 params=params,
@@ -276,7 +296,8 @@ def create_search_api(
     search_provider: str = "serper",
     serper_api_key: Optional[str] = None,
     searxng_instance_url: Optional[str] = None,
-    searxng_api_key: Optional[str] = None
+    searxng_api_key: Optional[str] = None,
+    search_cache: Optional[SearchCache] = None
 ) -> SearchAPI:
     """
     Factory function to create the appropriate search API client.
@@ -286,6 +307,7 @@ def create_search_api(
         serper_api_key: Optional API key for Serper
         searxng_instance_url: Optional SearXNG instance URL
         searxng_api_key: Optional API key for SearXNG instance
+        search_cache: Optional persistent cache of Serper results
 
     Returns:
         An instance of a SearchAPI implementation
@@ -294,7 +316,7 @@ def create_search_api(
         ValueError: If an invalid search provider is specified
     """
     if search_provider.lower() == "serper":
-        return SerperAPI(api_key=serper_api_key)
+        return SerperAPI(api_key=serper_api_key, cache=search_cache)
     elif search_provider.lower() == "searxng":
         return SearXNGAPI(instance_url=searxng_instance_url, api_key=searxng_api_key)
     else:
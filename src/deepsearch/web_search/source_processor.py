@@ -3,9 +3,19 @@ Reference:
 https://github.com/sentient-agi/OpenDeepSearch/blob/main/src/opendeepsearch/context_building/process_sources_pro.py
 
 """
+import asyncio
+import json
+import os
+import threading
 from dataclasses import dataclass
+from datetime import datetime
 from typing import List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .chunker import Chunker
 from .crawl4ai_scraper import WebScraper
 from .jina_reranker import JinaReranker
@@ -67,7 +77,7 @@ class SourceProcessor:
                 # If Wikipedia article exists, only process that
                 valid_sources = wiki_sources[:1]  # Take only the first Wikipedia source
             html_contents = await self._fetch_html_contents([s[1]['link'] for s in valid_sources])
-            return self._update_sources_with_content(sources.data, valid_sources, html_contents, query)
+            return await self._update_sources_with_content(sources.data, valid_sources, html_contents, query)
         except Exception as e:
             print(f"Error in process_sources: {e}")
             return sources
@@ -86,21 +96,10 @@ class SourceProcessor:
             # Split the HTML content into chunks
             documents = self.chunker.split_text(html)
 
-            # Save documents and query to JSON file
-            import json
-            import os
-            from datetime import datetime
-            
             # Create data directory if it doesn't exist
             os.makedirs("data", exist_ok=True)
-            
-            # Load existing documents if file exists
             json_file = "testing_reranked_documents.json"
-            stored_docs = []
-            if os.path.exists(json_file):
-                with open(json_file, "r") as f:
-                    stored_docs = json.load(f)
-            
+
             # Get reranked content first so we can store both original and ranked
             reranked_content = self.semantic_searcher.get_reranked_documents(
                 query,
@@ -116,12 +115,17 @@ class SourceProcessor:
                 "timestamp": datetime.now().isoformat()
             }
             
-            # Update stored documents, keeping only latest entry
+            # Save documents and query, keeping only the latest entry. Concurrent
+            # searches write the same file, so write a temp file and swap it in
+            # atomically; no fsync, the dump is regenerated on every search
             stored_docs = [doc_entry]
-            
-            # Save updated documents
-            with open(json_file, "w") as f:
-                json.dump(stored_docs, f, indent=2)
+            tmp_file = f"{json_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_file, "wb") as f:
+                if orjson is not None:
+                    f.write(orjson.dumps(stored_docs))
+                else:
+                    f.write(json.dumps(stored_docs, ensure_ascii=False).encode("utf-8"))
+            os.replace(tmp_file, json_file)
 
             print(f"Ranked content is saved in {json_file}")
             
@@ -131,14 +135,19 @@ class SourceProcessor:
             print(f"Error in content processing: {e}")
             return ""
 
-    def _update_sources_with_content(
+    async def _update_sources_with_content(
         self, 
         sources: List[dict],
         valid_sources: List[Tuple[int, dict]], 
         html_contents: List[str],
         query: str
     ) -> List[dict]:
-        for (i, source), html in zip(valid_sources, html_contents):
-            source['html'] = self._process_html_content(html, query)
-            # sources[i] = source
+        # Chunking and the blocking reranker HTTP calls run in worker threads,
+        # concurrently per source, instead of stalling the event loop
+        processed_contents = await asyncio.gather(*(
+            asyncio.to_thread(self._process_html_content, html, query)
+            for html in html_contents
+        ))
+        for (i, source), content in zip(valid_sources, processed_contents):
+            source['html'] = content
         return sources
@@ -1,11 +1,15 @@
 import re
+from functools import lru_cache
 from typing import List, Tuple
-import fasttext
-from huggingface_hub import hf_hub_download
 import wikipediaapi
 
-# Load the model
-model = fasttext.load_model(hf_hub_download("kenhktsui/llm-data-textbook-quality-fasttext-classifer-v2", "model.bin"))
+
+@lru_cache(maxsize=1)
+def get_quality_model():
+    """Download and load the fasttext quality classifier on first use."""
+    import fasttext
+    from huggingface_hub import hf_hub_download
+    return fasttext.load_model(hf_hub_download("kenhktsui/llm-data-textbook-quality-fasttext-classifer-v2", "model.bin"))
 
 def clean_markdown_links(text: str, min_quality_score: float = 0.2) -> Tuple[str, float]:
     """
@@ -100,7 +104,7 @@ def predict_educational_value(text_list: List[str]) -> List[float]:
     Returns a list of scores between 0 and 2.
     """
     text_list = [replace_newlines(text) for text in text_list]
-    pred = model.predict(text_list, k=-1)
+    pred = get_quality_model().predict(text_list, k=-1)
     score_list = []
     for l, s in zip(*pred):
         score = 0
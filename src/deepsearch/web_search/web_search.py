@@ -1,4 +1,47 @@
 import requests
+from requests.adapters import HTTPAdapter
+
+# Pooled connections, so repeated searches reuse the TCP/TLS connection to the provider
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0))
+SEARCH_TIMEOUT = 10
+
+
+def _build_request(query, api_key, provider):
+    """Return the endpoint, query parameters and organic results key of a provider."""
+    if provider == "serpapi":
+        params = {
+            "q": query,
+            "api_key": api_key,
+            "engine": "google",
+            "google_domain": "google.com",
+        }
+        return "https://serpapi.com/search.json", params, "organic_results"
+    params = {
+        "q": query,
+        "api_key": api_key,
+    }
+    return "https://google.serper.dev/search", params, "organic"
+
+
+def _format_results(results, organic_key):
+    """Render the organic results of a search response as markdown snippets."""
+    parts = ["## Search Results\n"]
+    for idx, page in enumerate(results.get(organic_key, ())):
+        if idx:
+            parts.append("\n\n")
+        parts.append(f"{idx}. [{page['title']}]({page['link']})")
+        date_published = page.get("date")
+        if date_published is not None:
+            parts.append("\nDate published: " + date_published)
+        source = page.get("source")
+        if source is not None:
+            parts.append("\nSource: " + source)
+        parts.append("\n")
+        snippet = page.get("snippet")
+        if snippet is not None:
+            parts.append("\n" + snippet)
+    return "".join(parts)
 
 
 def web_search(query, api_key, provider="serper"):
@@ -11,46 +54,13 @@ def web_search(query, api_key, provider="serper"):
     Returns:
         str: Web search results (snippets).
     """
-    if provider == "serpapi":
-        params = {
-            "q": query,
-            "api_key": api_key,
-            "engine": "google",
-            "google_domain": "google.com",
-        }
-        base_url = "https://serpapi.com/search.json"
-        organic_key = "organic_results"
-    else:
-        params = {
-            "q": query,
-            "api_key": api_key,
-        }
-        base_url = "https://google.serper.dev/search"
-        organic_key = "organic"
-
-    response = requests.get(base_url, params=params)
+    base_url, params, organic_key = _build_request(query, api_key, provider)
+    response = _SESSION.get(base_url, params=params, timeout=SEARCH_TIMEOUT)
 
     if response.status_code == 200:
         results = response.json()
     else:
         raise ValueError(response.json())
 
-    web_snippets = []
-    if organic_key in results:
-        for idx, page in enumerate(results[organic_key]):
-            date_published = ""
-            if "date" in page:
-                date_published = "\nDate published: " + page["date"]
-
-            source = ""
-            if "source" in page:
-                source = "\nSource: " + page["source"]
-
-            snippet = ""
-            if "snippet" in page:
-                snippet = "\n" + page["snippet"]
-
-            redacted_version = f"{idx}. [{page['title']}]({page['link']}){date_published}{source}\n{snippet}"
-            web_snippets.append(redacted_version)
+    return _format_results(results, organic_key)
 
-    return "## Search Results\n" + "\n\n".join(web_snippets)
@@ -33,19 +33,22 @@ async def solve(question):
         print("Failed without an answer!")  
     print(f"The answer is: {answer}")
 
+
+async def solve_all(questions, max_concurrency=4):
+    """Solve several questions concurrently, at most max_concurrency at a time to respect rate limits."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded_solve(question):
+        async with semaphore:
+            return await solve(question)
+
+    return await asyncio.gather(*(bounded_solve(q) for q in questions))
+
 #Sample query to test the code
 # query = "If my future wife has the same first name as the 15th first lady of the United States' mother and her surname is the same as the second assassinated president's mother's maiden name, what is my future wife's name? "
 query = """In feet, subtract the diameter of the pitching plate ("rubber") in softball, from the distance between the "points" of the bases in baseball, and multiply that figure by the year that Joe DiMaggio married Marilyn Monroe. """
+# Add more sample queries here to run them concurrently
+queries = [query]
 if __name__ == "__main__":
-    loop = asyncio.get_event_loop()
-    try:
-        loop.run_until_complete(solve(query))
-    finally:
-        # Cancel all pending tasks and close loop properly
-        pending = asyncio.all_tasks(loop=loop)
-        for task in pending:
-            task.cancel()
-        if pending:
-            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
-        loop.close()
+    asyncio.run(solve_all(queries))
 